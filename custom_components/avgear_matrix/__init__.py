@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
+from typing import Any
 
 import voluptuous as vol
 
@@ -10,7 +12,8 @@ from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.typing import ConfigType
 
 from .api import AVGearConnectionError, AVGearMatrixClient
 from .const import (
@@ -38,6 +41,21 @@ SERVICE_SAVE_PRESET = "save_preset"
 ATTR_PRESET = "preset"
 ATTR_DEVICE_ID = "device_id"
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+SAVE_PRESET_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_PRESET): vol.All(int, vol.Range(min=0, max=9)),
+        vol.Optional(ATTR_DEVICE_ID): str,
+    }
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the AVGear Matrix integration."""
+    _async_register_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: AVGearMatrixConfigEntry) -> bool:
     """Set up AVGear Matrix Switcher from a config entry."""
@@ -47,7 +65,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: AVGearMatrixConfigEntry)
     num_inputs = int(entry.data.get(CONF_NUM_INPUTS, NUM_INPUTS))
     num_outputs = int(entry.data.get(CONF_NUM_OUTPUTS, NUM_OUTPUTS))
 
-    client = AVGearMatrixClient(host, port, num_inputs, num_outputs)
+    # Reuse the connection validated by the config flow, if any
+    client: AVGearMatrixClient | None = hass.data.get(DOMAIN, {}).pop(
+        entry.unique_id, None
+    )
+    if client is None:
+        client = AVGearMatrixClient(host, port, num_inputs, num_outputs)
 
     coordinator = AVGearMatrixCoordinator(hass, client, entry, scan_interval)
 
@@ -57,11 +80,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: AVGearMatrixConfigEntry)
         await client.disconnect()
         raise ConfigEntryNotReady(f"Cannot connect to {host}:{port}") from err
 
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        await client.disconnect()
+        raise
 
     entry.runtime_data = coordinator
 
-    # Register device
+    _async_register_device(hass, entry, coordinator)
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    return True
+
+
+def _async_register_device(
+    hass: HomeAssistant,
+    entry: AVGearMatrixConfigEntry,
+    coordinator: AVGearMatrixCoordinator,
+) -> None:
+    """Register the matrix in the device registry."""
     device_registry = dr.async_get(hass)
     device_registry.async_get_or_create(
         config_entry_id=entry.entry_id,
@@ -72,20 +113,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: AVGearMatrixConfigEntry)
         sw_version=coordinator.device_info.get("firmware"),
     )
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    entry.async_on_unload(entry.add_update_listener(async_update_options))
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
 
-    # Register services
     async def handle_save_preset(call: ServiceCall) -> None:
         """Handle the save_preset service call."""
         preset = call.data[ATTR_PRESET]
         device_id = call.data.get(ATTR_DEVICE_ID)
 
-        loaded_entries = [
-            e for e in hass.config_entries.async_entries(DOMAIN)
+        loaded_entries: dict[str, AVGearMatrixConfigEntry] = {
+            e.entry_id: e
+            for e in hass.config_entries.async_entries(DOMAIN)
             if e.state is ConfigEntryState.LOADED
-        ]
+        }
 
         if not loaded_entries:
             raise ServiceValidationError("No AVGear Matrix devices are loaded")
@@ -96,14 +137,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: AVGearMatrixConfigEntry)
             device_registry = dr.async_get(hass)
             device = device_registry.async_get(device_id)
             if device:
-                for entry in loaded_entries:
-                    if entry.entry_id in device.config_entries:
-                        target_entry = entry
-                        break
+                target_entry = next(
+                    (
+                        loaded_entries[entry_id]
+                        for entry_id in device.config_entries
+                        if entry_id in loaded_entries
+                    ),
+                    None,
+                )
             if target_entry is None:
                 raise ServiceValidationError("Selected device is not an AVGear Matrix")
         elif len(loaded_entries) == 1:
-            target_entry = loaded_entries[0]
+            target_entry = next(iter(loaded_entries.values()))
         else:
             raise ServiceValidationError(
                 "Multiple AVGear Matrix devices loaded; specify a device_id"
@@ -111,23 +156,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: AVGearMatrixConfigEntry)
 
         await target_entry.runtime_data.async_save_preset(preset)
 
-    if not hass.services.has_service(DOMAIN, SERVICE_SAVE_PRESET):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SAVE_PRESET,
-            handle_save_preset,
-            schema=vol.Schema(
-                {
-                    vol.Required(ATTR_PRESET): vol.All(
-                        int, vol.Range(min=0, max=9)
-                    ),
-                    vol.Optional(ATTR_DEVICE_ID): str,
-                }
-            ),
-            supports_response=False,
-        )
-
-    return True
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SAVE_PRESET,
+        handle_save_preset,
+        schema=SAVE_PRESET_SCHEMA,
+        supports_response=False,
+    )
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: AVGearMatrixConfigEntry) -> bool:
@@ -135,58 +170,81 @@ async def async_unload_entry(hass: HomeAssistant, entry: AVGearMatrixConfigEntry
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator = entry.runtime_data
         await coordinator.client.disconnect()
-
-    # Unregister service if no more loaded entries remain
-    loaded_entries = [
-        e for e in hass.config_entries.async_entries(DOMAIN)
-        if e.state is ConfigEntryState.LOADED and e.entry_id != entry.entry_id
-    ]
-    if unload_ok and not loaded_entries:
-        hass.services.async_remove(DOMAIN, SERVICE_SAVE_PRESET)
+        await _async_discard_parked_client(hass, entry)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: AVGearMatrixConfigEntry) -> None:
+    """Handle removal of a config entry."""
+    await _async_discard_parked_client(hass, entry)
+
+
+async def _async_discard_parked_client(
+    hass: HomeAssistant, entry: AVGearMatrixConfigEntry
+) -> None:
+    """Disconnect a config-flow client that setup never picked up."""
+    if client := hass.data.get(DOMAIN, {}).pop(entry.unique_id, None):
+        await client.disconnect()
+
+
 async def async_update_options(hass: HomeAssistant, entry: AVGearMatrixConfigEntry) -> None:
     """Update options."""
+    coordinator = entry.runtime_data
+    if not coordinator.names_changed(entry.options):
+        # Only the scan interval changed; apply it without a reload
+        coordinator.update_interval = timedelta(
+            seconds=int(entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+        )
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
-async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
-    """Migrate old config entry to new version."""
-    _LOGGER.debug("Migrating from version %s", config_entry.version)
+def _migrate_to_v3(
+    data: dict[str, Any], options: dict[str, Any]
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Strip output_names, keep input_names and preset_names."""
+    return data, {
+        CONF_SCAN_INTERVAL: int(options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)),
+        CONF_INPUT_NAMES: options.get(CONF_INPUT_NAMES, {}),
+        CONF_PRESET_NAMES: options.get(CONF_PRESET_NAMES, {}),
+    }
 
-    if config_entry.version < 3:
-        # Migrate to v3: strip output_names, keep input_names and preset_names
-        old_options = {**config_entry.options}
 
-        # Collect input names from any version
-        input_names: dict[str, str] = old_options.get(CONF_INPUT_NAMES, {})
+def _migrate_to_v4(
+    data: dict[str, Any], options: dict[str, Any]
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Add num_inputs and num_outputs to data."""
+    return {CONF_NUM_INPUTS: NUM_INPUTS, CONF_NUM_OUTPUTS: NUM_OUTPUTS, **data}, options
 
-        # Collect preset names from any version
-        preset_names: dict[str, str] = old_options.get(CONF_PRESET_NAMES, {})
 
-        new_options = {
-            CONF_SCAN_INTERVAL: int(old_options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)),
-            CONF_INPUT_NAMES: input_names,
-            CONF_PRESET_NAMES: preset_names,
-        }
+# (target version, migration step), applied in order
+_MIGRATIONS = (
+    (3, _migrate_to_v3),
+    (4, _migrate_to_v4),
+)
 
-        hass.config_entries.async_update_entry(
-            config_entry, options=new_options, version=3
-        )
 
-    if config_entry.version < 4:
-        # Migrate to v4: add num_inputs and num_outputs to data
-        new_data = {**config_entry.data}
-        if CONF_NUM_INPUTS not in new_data:
-            new_data[CONF_NUM_INPUTS] = NUM_INPUTS
-        if CONF_NUM_OUTPUTS not in new_data:
-            new_data[CONF_NUM_OUTPUTS] = NUM_OUTPUTS
+async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    """Migrate old config entry to new version."""
+    _LOGGER.debug("Migrating from version %s", config_entry.version)
 
-        hass.config_entries.async_update_entry(
-            config_entry, data=new_data, version=4
-        )
+    # Apply every pending step in memory, then persist once
+    data = dict(config_entry.data)
+    options = dict(config_entry.options)
+    version = config_entry.version
+    for target, migrate in _MIGRATIONS:
+        if version < target:
+            data, options = migrate(data, options)
+            version = target
+
+    if version != config_entry.version:
+        changes: dict[str, Any] = {"version": version}
+        if data != config_entry.data:
+            changes["data"] = data
+        if options != config_entry.options:
+            changes["options"] = options
+        hass.config_entries.async_update_entry(config_entry, **changes)
 
     _LOGGER.debug("Migration to version %s successful", config_entry.version)
     return True
@@ -5,16 +5,96 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-from dataclasses import dataclass, field
+from array import array
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
 # Connection settings
 DEFAULT_TIMEOUT = 5.0
-COMMAND_DELAY = 0.1  # Delay between commands
+HAPPY_EYEBALLS_DELAY = 0.25  # Stagger between parallel connection attempts
+COMMAND_DELAY = 0.1  # Gap between commands in a batch (protocol advises 50-150 ms)
+FLUSH_TIMEOUT = 0.005  # Wait for already-buffered bytes when flushing stale data
 BUFFER_SIZE = 4096  # Socket read buffer size
-DRAIN_TIMEOUT = 0.1  # Timeout for draining additional response data
+DRAIN_TIMEOUT = 0.1  # Quiet period that ends a multi-line or unterminated reply
+
+# Protocol terminators; a single-line reply ending in one is complete
+_TERMINATORS = {"status": b".", "query": b";"}
+
+# Fixed commands, pre-encoded
+_CMD_TYPE = b"/*Type;"
+_CMD_VERSION = b"/^Version;"
+_CMD_STATUS = b"Status."
+_CMD_POWER_STATE = b"%9962."
+_CMD_LOCK_STATE = b"%9961."
+_CMD_ALL_OFF = b"All$."
+_CMD_ALL_THROUGH = b"All#."
+_CMD_PWON = b"PWON."
+_CMD_PWOFF = b"PWOFF."
+_CMD_STANDBY = b"STANDBY."
+_CMD_LOCK = b"/%Lock;"
+_CMD_UNLOCK = b"/%Unlock;"
+
+# Commands documented to reply with a single line (model, firmware, power,
+# lock); every other reply is read until the line goes quiet
+_SINGLE_LINE_COMMANDS = frozenset(
+    {_CMD_TYPE, _CMD_VERSION, _CMD_POWER_STATE, _CMD_LOCK_STATE, _CMD_LOCK, _CMD_UNLOCK}
+)
+
+# Status reply formats in one alternation, AVGear format first
+_STATUS_RE = re.compile(
+    r"AV:(?P<av_in>\d+)->(?P<av_out>\d+)"  # AV:01->02 means input 1 to output 2
+    r"|O(?P<o_out>\d+)[:\-]I(?P<o_in>\d+)"  # O1-I2 or O1:I2
+    r"|Out(?:put)?(?P<v_out>\d+)[:\-]In(?:put)?(?P<v_in>\d+)"  # Output1:Input2
+    r"|(?P<p_out>\d+)[:\-](?P<p_in>\d+)",  # Simple 1:2 pairs (output:input)
+    re.IGNORECASE,
+)
+# Last group of each alternative -> (input group, output group), in the
+# priority order used to pick a reply's format
+_STATUS_GROUPS = {
+    "av_out": ("av_in", "av_out"),
+    "o_in": ("o_in", "o_out"),
+    "v_in": ("v_in", "v_out"),
+    "p_in": ("p_in", "p_out"),
+}
+_AV_ROUTE_RE = re.compile(r"AV:(\d+)->(\d+)")
+
+
+@lru_cache(maxsize=256)
+def _route_command(input_num: int, output_num: int) -> bytes:
+    """Return the encoded command routing an input to an output."""
+    return f"{input_num:02d}V{output_num:02d}.".encode("ascii")
+
+
+@lru_cache(maxsize=256)
+def _format_command(template: str, value: int) -> bytes:
+    """Return an encoded single-parameter command, e.g. Status01. or Save3."""
+    return template.format(value).encode("ascii")
+
+
+def _parse_input_number(response: str) -> int | None:
+    """Return the number after the first "In"/"Input" label in a reply.
+
+    Hand-rolled equivalent of the regex [Ii]n(?:put)?[:\\s]*(\\d+).
+    """
+    length = len(response)
+    pos = response.find("n", 1)
+    while pos != -1:
+        if response[pos - 1] in "Ii":
+            start = pos + 1
+            if response.startswith("put", start):
+                start += 3
+            while start < length and (response[start] == ":" or response[start].isspace()):
+                start += 1
+            end = start
+            while end < length and response[end].isdecimal():
+                end += 1
+            if end > start:
+                return int(response[start:end])
+        pos = response.find("n", pos + 1)
+    return None
 
 
 class AVGearConnectionError(Exception):
@@ -25,11 +105,12 @@ class AVGearCommandError(Exception):
     """Exception for command errors."""
 
 
-@dataclass
+@dataclass(slots=True)
 class MatrixStatus:
     """Represents the current state of the matrix."""
 
-    outputs: dict[int, int | None] = field(default_factory=dict)  # output -> input (None = off)
+    # Input routed to each output, indexed by output - 1 (0 = off/unknown)
+    outputs: array[int] = field(default_factory=lambda: array("B"))
     model: str = ""
     firmware: str = ""
     locked: bool = False
@@ -37,7 +118,17 @@ class MatrixStatus:
 
     def get_output_input(self, output: int) -> int | None:
         """Get the input routed to a specific output."""
-        return self.outputs.get(output)
+        if not (1 <= output <= len(self.outputs)):
+            return None
+        return self.outputs[output - 1] or None
+
+    def set_output_input(self, output: int, input_num: int | None) -> None:
+        """Set the input routed to a specific output (None = off)."""
+        self.outputs[output - 1] = input_num or 0
+
+    def copy(self) -> MatrixStatus:
+        """Return a snapshot that later client updates will not mutate."""
+        return replace(self, outputs=array("B", self.outputs))
 
 
 class AVGearMatrixClient:
@@ -58,7 +149,8 @@ class AVGearMatrixClient:
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
         self._lock = asyncio.Lock()
-        self._status = MatrixStatus()
+        self._status = MatrixStatus(outputs=array("B", bytes(self._num_outputs)))
+        self._resolved_host: str | None = None  # Address of the last successful connection
 
     @property
     def host(self) -> str:
@@ -85,17 +177,30 @@ class AVGearMatrixClient:
         if self.connected:
             return
 
+        # Reconnect to the previously resolved address to skip DNS lookups
         try:
             self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self._host, self._port),
+                asyncio.open_connection(
+                    self._resolved_host or self._host,
+                    self._port,
+                    happy_eyeballs_delay=HAPPY_EYEBALLS_DELAY,
+                ),
                 timeout=DEFAULT_TIMEOUT,
             )
             _LOGGER.debug("Connected to AVGear Matrix at %s:%s", self._host, self._port)
         except asyncio.TimeoutError as err:
+            self._resolved_host = None
             raise AVGearConnectionError(f"Timeout connecting to {self._host}:{self._port}") from err
         except OSError as err:
+            self._resolved_host = None
             raise AVGearConnectionError(f"Cannot connect to {self._host}:{self._port}: {err}") from err
 
+        # Only cache IPv4 peers: an IPv6 peername's host string drops the
+        # scope id, which a link-local reconnect would need
+        peername = self._writer.get_extra_info("peername")
+        if peername and len(peername) == 2:
+            self._resolved_host = peername[0]
+
     async def disconnect(self) -> None:
         """Close TCP connection."""
         if self._writer:
@@ -109,90 +214,155 @@ class AVGearMatrixClient:
                 self._reader = None
             _LOGGER.debug("Disconnected from AVGear Matrix")
 
-    async def _send_command(self, command: str) -> str:
+    async def _send_command(self, command: bytes) -> str:
         """Send a command and return the response."""
         async with self._lock:
-            if not self.connected:
-                await self.connect()
+            return await self._exchange(command)
+
+    async def _send_commands(self, *commands: bytes) -> list[str]:
+        """Send several commands back-to-back and return their responses.
+
+        The lock is held for the whole batch, so commands from other callers
+        cannot interleave and the batch only waits for the lock once. The
+        first reply is read until the line goes quiet and the commands are
+        spaced by COMMAND_DELAY so the device can keep up.
+        """
+        async with self._lock:
+            responses = [await self._exchange(commands[0], settle=True)]
+            for command in commands[1:]:
+                await asyncio.sleep(COMMAND_DELAY)
+                responses.append(await self._exchange(command))
+            return responses
 
-            if self._writer is None or self._reader is None:
-                raise AVGearConnectionError("Not connected")
+    @staticmethod
+    async def _discard_pending(reader: asyncio.StreamReader) -> None:
+        """Drop unread bytes so they cannot pass for the next reply.
 
+        Late tails of earlier replies and unsolicited feedback are already
+        buffered, so a read returns them at once; an empty buffer only
+        costs FLUSH_TIMEOUT.
+        """
+        while True:
             try:
-                _LOGGER.debug("Sending command: %s", command)
-                self._writer.write(command.encode("ascii"))
-                await self._writer.drain()
+                stale = await asyncio.wait_for(reader.read(BUFFER_SIZE), timeout=FLUSH_TIMEOUT)
+            except asyncio.TimeoutError:
+                return
+            if not stale:
+                return
+            _LOGGER.debug("Discarding unread data: %s", stale)
+
+    async def _exchange(self, command: bytes, *, settle: bool = False) -> str:
+        """Write one command and read its response; the lock must be held.
+
+        With settle, even a single-line reply is read until the line goes
+        quiet, leaving nothing behind for the next command.
+        """
+        if not self.connected:
+            await self.connect()
 
-                # Small delay for device processing
-                await asyncio.sleep(COMMAND_DELAY)
+        if self._writer is None or self._reader is None:
+            raise AVGearConnectionError("Not connected")
 
-                # Read response with timeout; drain any additional data briefly
-                response = await asyncio.wait_for(
+        try:
+            await self._discard_pending(self._reader)
+            _LOGGER.debug("Sending command: %s", command.decode("ascii"))
+            self._writer.write(command)
+            await self._writer.drain()
+
+            # Known single-line replies end at their line ending or
+            # terminator; feedback is otherwise best effort and may span
+            # several lines, so any other reply is read until it goes quiet
+            terminator = _TERMINATORS["query" if command.endswith(b";") else "status"]
+            single_line = not settle and command in _SINGLE_LINE_COMMANDS
+            buffer = bytearray(
+                await asyncio.wait_for(
                     self._reader.read(BUFFER_SIZE),
                     timeout=DEFAULT_TIMEOUT,
                 )
-                chunks = [response]
-                while True:
-                    try:
-                        more = await asyncio.wait_for(self._reader.read(BUFFER_SIZE), timeout=DRAIN_TIMEOUT)
-                    except asyncio.TimeoutError:
-                        break
-                    if not more:
-                        break
-                    chunks.append(more)
-
-                response_text = b"".join(chunks).decode("ascii", errors="replace").strip()
-                _LOGGER.debug("Received response: %s", response_text)
-                return response_text
-
-            except asyncio.TimeoutError as err:
-                await self.disconnect()
-                raise AVGearConnectionError("Timeout waiting for response") from err
-            except OSError as err:
-                await self.disconnect()
-                raise AVGearConnectionError(f"Communication error: {err}") from err
+            )
+            while buffer and not (
+                single_line
+                and buffer.strip()
+                and (buffer.endswith(b"\n") or buffer.rstrip().endswith(terminator))
+            ):
+                try:
+                    more = await asyncio.wait_for(self._reader.read(BUFFER_SIZE), timeout=DRAIN_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not more:
+                    break
+                buffer += more
+
+            response_text = buffer.decode("ascii", errors="replace").strip()
+            _LOGGER.debug("Received response: %s", response_text)
+            return response_text
+
+        except asyncio.TimeoutError as err:
+            await self.disconnect()
+            raise AVGearConnectionError("Timeout waiting for response") from err
+        except OSError as err:
+            await self.disconnect()
+            raise AVGearConnectionError(f"Communication error: {err}") from err
 
     # --- Query Commands ---
 
     async def get_model(self) -> str:
         """Query device model."""
-        response = await self._send_command("/*Type;")
+        response = await self._send_command(_CMD_TYPE)
         self._status.model = response
         return response
 
     async def get_firmware(self) -> str:
         """Query firmware version."""
-        response = await self._send_command("/^Version;")
+        response = await self._send_command(_CMD_VERSION)
         self._status.firmware = response
         return response
 
     async def get_status(self) -> MatrixStatus:
         """Query full routing status."""
-        response = await self._send_command("Status.")
+        response = await self._send_command(_CMD_STATUS)
         self._parse_status_response(response)
         return self._status
 
+    async def get_status_bundle(self) -> MatrixStatus:
+        """Query routing, power and lock state in one batch.
+
+        All three queries run under a single lock hold so no other command
+        interleaves. Routing errors are raised; the power and lock queries
+        are best effort and keep their previous values on failure.
+        """
+        async with self._lock:
+            self._parse_status_response(await self._exchange(_CMD_STATUS, settle=True))
+            await asyncio.sleep(COMMAND_DELAY)
+            try:
+                self._parse_power_state(await self._exchange(_CMD_POWER_STATE))
+            except AVGearConnectionError:
+                _LOGGER.debug("Failed to fetch power state")
+            await asyncio.sleep(COMMAND_DELAY)
+            try:
+                self._parse_lock_state(await self._exchange(_CMD_LOCK_STATE))
+            except AVGearConnectionError:
+                _LOGGER.debug("Failed to fetch lock status")
+        return self._status
+
     async def get_output_status(self, output: int) -> int | None:
-        """Query status of a specific output."""
-        response = await self._send_command(f"Status{output:02d}.")
+        """Query status of a specific output.
+
+        Costs one round-trip per output; for polling use get_status, which
+        reads every route from a single Status. reply.
+        """
+        response = await self._send_command(_format_command("Status{:02d}.", output))
         # Parse individual output response
         return self._parse_single_output(response, output)
 
     async def get_power_state(self) -> str:
         """Query power state."""
-        response = await self._send_command("%9962.")
-        if "STANDBY" in response.upper():
-            self._status.power_state = "STANDBY"
-        elif "PWOFF" in response.upper():
-            self._status.power_state = "PWOFF"
-        else:
-            self._status.power_state = "PWON"
+        self._parse_power_state(await self._send_command(_CMD_POWER_STATE))
         return self._status.power_state
 
     async def get_lock_status(self) -> bool:
         """Query panel lock status."""
-        response = await self._send_command("%9961.")
-        self._status.locked = "locked" in response.lower()
+        self._parse_lock_state(await self._send_command(_CMD_LOCK_STATE))
         return self._status.locked
 
     # --- Switching Commands ---
@@ -206,9 +376,8 @@ class AVGearMatrixClient:
         """
         if not (1 <= input_num <= self._num_inputs) or not (1 <= output_num <= self._num_outputs):
             raise AVGearCommandError(f"Input must be 1-{self._num_inputs} and output 1-{self._num_outputs}")
-        command = f"{input_num:02d}V{output_num:02d}."
-        await self._send_command(command)
-        self._status.outputs[output_num] = input_num
+        await self._send_command(_route_command(input_num, output_num))
+        self._status.set_output_input(output_num, input_num)
         return True
 
     async def route_input_to_all(self, input_num: int) -> bool:
@@ -218,10 +387,8 @@ class AVGearMatrixClient:
         """
         if not (1 <= input_num <= self._num_inputs):
             raise AVGearCommandError(f"Input must be 1-{self._num_inputs}")
-        command = f"{input_num:02d}All."
-        await self._send_command(command)
-        for out in range(1, self._num_outputs + 1):
-            self._status.outputs[out] = input_num
+        await self._send_command(_format_command("{:02d}All.", input_num))
+        self._status.outputs[:] = array("B", [input_num] * self._num_outputs)
         return True
 
     async def switch_off_output(self, output_num: int) -> bool:
@@ -231,17 +398,15 @@ class AVGearMatrixClient:
         """
         if not (1 <= output_num <= self._num_outputs):
             raise AVGearCommandError(f"Output must be 1-{self._num_outputs}")
-        command = f"{output_num:02d}$."
-        await self._send_command(command)
-        self._status.outputs[output_num] = None
+        await self._send_command(_format_command("{:02d}$.", output_num))
+        self._status.set_output_input(output_num, None)
         return True
 
     async def switch_on_output(self, output_num: int) -> bool:
         """Switch on (open) an output."""
         if not (1 <= output_num <= self._num_outputs):
             raise AVGearCommandError(f"Output must be 1-{self._num_outputs}")
-        command = f"{output_num:02d}@."
-        await self._send_command(command)
+        await self._send_command(_format_command("{:02d}@.", output_num))
         return True
 
     async def switch_off_all(self) -> bool:
@@ -249,9 +414,8 @@ class AVGearMatrixClient:
         
         Note: Updates internal state optimistically. See route_input_to_output.
         """
-        await self._send_command("All$.")
-        for out in range(1, self._num_outputs + 1):
-            self._status.outputs[out] = None
+        await self._send_command(_CMD_ALL_OFF)
+        self._status.outputs[:] = array("B", bytes(self._num_outputs))
         return True
 
     async def all_through(self) -> bool:
@@ -259,9 +423,8 @@ class AVGearMatrixClient:
         
         Note: Updates internal state optimistically. See route_input_to_output.
         """
-        await self._send_command("All#.")
-        for i in range(1, self._num_outputs + 1):
-            self._status.outputs[i] = i
+        await self._send_command(_CMD_ALL_THROUGH)
+        self._status.outputs[:] = array("B", range(1, self._num_outputs + 1))
         return True
 
     # --- Preset Commands ---
@@ -270,42 +433,44 @@ class AVGearMatrixClient:
         """Save current state to preset."""
         if not (0 <= preset <= 9):
             raise AVGearCommandError("Preset must be 0-9")
-        await self._send_command(f"Save{preset}.")
+        await self._send_command(_format_command("Save{}.", preset))
         return True
 
     async def recall_preset(self, preset: int) -> bool:
         """Recall a preset."""
         if not (0 <= preset <= 9):
             raise AVGearCommandError("Preset must be 0-9")
-        await self._send_command(f"Recall{preset}.")
-        # Refresh status after preset recall
-        await self.get_status()
+        # Refresh status in the same batch as the recall
+        _, response = await self._send_commands(
+            _format_command("Recall{}.", preset), _CMD_STATUS
+        )
+        self._parse_status_response(response)
         return True
 
     async def clear_preset(self, preset: int) -> bool:
         """Clear a preset."""
         if not (0 <= preset <= 9):
             raise AVGearCommandError("Preset must be 0-9")
-        await self._send_command(f"Clear{preset}.")
+        await self._send_command(_format_command("Clear{}.", preset))
         return True
 
     # --- Power Commands ---
 
     async def power_on(self) -> bool:
         """Set normal working mode."""
-        await self._send_command("PWON.")
+        await self._send_command(_CMD_PWON)
         self._status.power_state = "PWON"
         return True
 
     async def power_off(self) -> bool:
         """Set standby and cut power to receivers."""
-        await self._send_command("PWOFF.")
+        await self._send_command(_CMD_PWOFF)
         self._status.power_state = "PWOFF"
         return True
 
     async def standby(self) -> bool:
         """Set standby (keeps PoC power)."""
-        await self._send_command("STANDBY.")
+        await self._send_command(_CMD_STANDBY)
         self._status.power_state = "STANDBY"
         return True
 
@@ -313,13 +478,13 @@ class AVGearMatrixClient:
 
     async def lock_panel(self) -> bool:
         """Lock front panel buttons."""
-        await self._send_command("/%Lock;")
+        await self._send_command(_CMD_LOCK)
         self._status.locked = True
         return True
 
     async def unlock_panel(self) -> bool:
         """Unlock front panel buttons."""
-        await self._send_command("/%Unlock;")
+        await self._send_command(_CMD_UNLOCK)
         self._status.locked = False
         return True
 
@@ -334,46 +499,40 @@ class AVGearMatrixClient:
         - "Output1:Input1 Output2:Input2..." (verbose format)
         - "1:2 3:4..." (simple number pairs)
         """
-        # Initialize all outputs as None (unknown)
-        for out in range(1, self._num_outputs + 1):
-            if out not in self._status.outputs:
-                self._status.outputs[out] = None
-
-        # Pattern: Try AVGear format first (AV:input->output), then fallback patterns
-        patterns = [
-            (r"AV:(\d+)->(\d+)", "input_output"),  # AV:01->02 means input 1 to output 2
-            (r"O(\d+)[:\-]I(\d+)", "output_input"),  # O1-I2 or O1:I2
-            (r"Out(?:put)?(\d+)[:\-]In(?:put)?(\d+)", "output_input"),  # Output1:Input2
-            (r"(\d+)[:\-](\d+)", "output_input"),  # Simple 1:2 pairs (output:input)
-        ]
-
-        parse_success = False
-        for pattern, order in patterns:
-            matches = re.findall(pattern, response, re.IGNORECASE)
-            if matches:
-                parse_success = True
-                for first_str, second_str in matches:
-                    try:
-                        first_num = int(first_str)
-                        second_num = int(second_str)
-                        
-                        # Determine input and output based on pattern type
-                        if order == "input_output":
-                            in_num, out_num = first_num, second_num
-                        else:  # output_input
-                            out_num, in_num = first_num, second_num
-                        
-                        if 1 <= out_num <= self._num_outputs and 0 <= in_num <= self._num_inputs:
-                            self._status.outputs[out_num] = in_num if in_num > 0 else None
-                    except ValueError:
-                        continue
+        # Single scan, bucketed by format; only the highest-priority format
+        # present is applied, so stray "10:30"-style text cannot shadow it
+        buckets: dict[str, list[re.Match[str]]] = {}
+        for match in _STATUS_RE.finditer(response):
+            buckets.setdefault(match.lastgroup, []).append(match)
+
+        for reply_format, (in_group, out_group) in _STATUS_GROUPS.items():
+            if matches := buckets.get(reply_format):
+                for match in matches:
+                    in_num = int(match.group(in_group))
+                    out_num = int(match.group(out_group))
+                    if 1 <= out_num <= self._num_outputs and 0 <= in_num <= self._num_inputs:
+                        self._status.outputs[out_num - 1] = in_num
                 break
-
-        if not parse_success and response:
-            _LOGGER.warning("Failed to parse status response: %s", response)
+        else:
+            if response:
+                _LOGGER.warning("Failed to parse status response: %s", response)
         
         _LOGGER.debug("Parsed status: %s", self._status.outputs)
 
+    def _parse_power_state(self, response: str) -> None:
+        """Parse a power state response."""
+        response = response.upper()
+        if "STANDBY" in response:
+            self._status.power_state = "STANDBY"
+        elif "PWOFF" in response:
+            self._status.power_state = "PWOFF"
+        else:
+            self._status.power_state = "PWON"
+
+    def _parse_lock_state(self, response: str) -> None:
+        """Parse a panel lock state response."""
+        self._status.locked = "locked" in response.lower()
+
     def _parse_single_output(self, response: str, output: int) -> int | None:
         """Parse response for a single output query.
         
@@ -383,33 +542,33 @@ class AVGearMatrixClient:
         - "closed" or "off" (output is off)
         """
         # Try AVGear format (AV:input->output) for the specific output
-        av_match = re.search(rf"AV:(\d+)->{output:02d}", response)
-        if av_match:
-            input_num = int(av_match.group(1))
+        for input_str, output_str in _AV_ROUTE_RE.findall(response):
+            if int(output_str) != output:
+                continue
+            input_num = int(input_str)
             if 1 <= input_num <= self._num_inputs:
-                self._status.outputs[output] = input_num
+                self._status.set_output_input(output, input_num)
                 return input_num
-        
+            break
+
         # Try to find an input number in generic format
-        match = re.search(r"[Ii]n(?:put)?[:\s]*(\d+)", response)
-        if match:
-            input_num = int(match.group(1))
-            if 1 <= input_num <= self._num_inputs:
-                self._status.outputs[output] = input_num
-                return input_num
+        input_num = _parse_input_number(response)
+        if input_num is not None and 1 <= input_num <= self._num_inputs:
+            self._status.set_output_input(output, input_num)
+            return input_num
 
         # Check for "closed" or "off" indicators
-        if "closed" in response.lower() or "off" in response.lower():
-            self._status.outputs[output] = None
+        response_lower = response.lower()
+        if "closed" in response_lower or "off" in response_lower:
+            self._status.set_output_input(output, None)
             return None
 
-        return self._status.outputs.get(output)
+        return self._status.get_output_input(output)
 
     async def test_connection(self) -> dict[str, Any]:
         """Test connection and return device info."""
         await self.connect()
-        info = {
-            "model": await self.get_model(),
-            "firmware": await self.get_firmware(),
-        }
-        return info
+        model, firmware = await self._send_commands(_CMD_TYPE, _CMD_VERSION)
+        self._status.model = model
+        self._status.firmware = firmware
+        return {"model": model, "firmware": firmware}
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -45,15 +46,13 @@ class AVGearSavePresetButton(AVGearBaseEntity, ButtonEntity):
 
     def __init__(self, coordinator: AVGearMatrixCoordinator) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_save_preset"
+        super().__init__(coordinator, "save_preset")
 
     async def async_press(self) -> None:
         """Save current routing to the selected preset."""
         preset = self.coordinator.current_preset
         if preset is None:
-            _LOGGER.warning("No preset selected, cannot save")
-            return
+            raise ServiceValidationError("No preset selected, cannot save")
 
         try:
             await self.coordinator.async_save_preset(preset)
@@ -69,8 +68,7 @@ class AVGearAllThroughButton(AVGearBaseEntity, ButtonEntity):
 
     def __init__(self, coordinator: AVGearMatrixCoordinator) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_all_through"
+        super().__init__(coordinator, "all_through")
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -85,8 +83,7 @@ class AVGearAllOffButton(AVGearBaseEntity, ButtonEntity):
 
     def __init__(self, coordinator: AVGearMatrixCoordinator) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_all_off"
+        super().__init__(coordinator, "all_off")
 
     async def async_press(self) -> None:
         """Handle the button press."""
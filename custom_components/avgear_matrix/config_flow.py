@@ -27,6 +27,7 @@ from .const import (
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_INPUTS_OUTPUTS,
     MAX_NAME_LENGTH,
     NUM_INPUTS,
     NUM_OUTPUTS,
@@ -36,7 +37,19 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 INPUT_OUTPUT_SELECTOR = NumberSelector(
-    NumberSelectorConfig(min=1, max=32, mode=NumberSelectorMode.BOX)
+    NumberSelectorConfig(min=1, max=MAX_INPUTS_OUTPUTS, mode=NumberSelectorMode.BOX)
+)
+
+# Name validator: enforce max length
+NAME_VALIDATOR = vol.All(str, vol.Length(max=MAX_NAME_LENGTH))
+
+# (form key, options key, placeholder) for every name field, precomputed
+# for the most inputs INPUT_OUTPUT_SELECTOR allows
+_INPUT_NAME_FIELDS = tuple(
+    (f"input_{i}_name", str(i), f"Input {i}") for i in range(1, MAX_INPUTS_OUTPUTS + 1)
+)
+_PRESET_NAME_FIELDS = tuple(
+    (f"preset_{i}_name", str(i), f"Preset {i}") for i in range(NUM_PRESETS)
 )
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
@@ -49,6 +62,36 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+def _build_options_schema(
+    num_inputs: int,
+    scan_interval: int,
+    input_names: dict[str, str],
+    preset_names: dict[str, str],
+) -> vol.Schema:
+    """Build the options schema with the given names as defaults."""
+    # Build schema with all name fields
+    schema_dict: dict[Any, Any] = {
+        vol.Required(CONF_SCAN_INTERVAL, default=scan_interval): vol.All(
+            int, vol.Range(min=5, max=300)
+        ),
+    }
+
+    # Add input and preset name fields with placeholders
+    for fields, names in (
+        (_INPUT_NAME_FIELDS[:num_inputs], input_names),
+        (_PRESET_NAME_FIELDS, preset_names),
+    ):
+        for key, index, placeholder in fields:
+            default_name = names.get(index, "")
+            schema_dict[vol.Optional(
+                key,
+                default=default_name,
+                description={"suggested_value": default_name or placeholder},
+            )] = NAME_VALIDATOR
+
+    return vol.Schema(schema_dict)
+
+
 class AVGearMatrixConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for AVGear Matrix Switcher."""
 
@@ -74,7 +117,15 @@ class AVGearMatrixConfigFlow(ConfigFlow, domain=DOMAIN):
             client = AVGearMatrixClient(host, port, num_inputs, num_outputs)
             try:
                 info = await client.test_connection()
-                await client.disconnect()
+            except AVGearConnectionError:
+                errors["base"] = "cannot_connect"
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Unexpected exception")
+                errors["base"] = "unknown"
+            else:
+                # Hand the open connection to async_setup_entry so the
+                # new entry does not have to reconnect
+                self.hass.data.setdefault(DOMAIN, {})[self.unique_id] = client
 
                 title = info.get("model", "AVGear Matrix") or "AVGear Matrix"
                 return self.async_create_entry(
@@ -86,13 +137,8 @@ class AVGearMatrixConfigFlow(ConfigFlow, domain=DOMAIN):
                         CONF_NUM_OUTPUTS: num_outputs,
                     },
                 )
-            except AVGearConnectionError:
-                errors["base"] = "cannot_connect"
-            except Exception:  # noqa: BLE001
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
-            finally:
-                await client.disconnect()
+
+            await client.disconnect()
 
         return self.async_show_form(
             step_id="user",
@@ -116,7 +162,6 @@ class AVGearMatrixConfigFlow(ConfigFlow, domain=DOMAIN):
             client = AVGearMatrixClient(host, port, num_inputs, num_outputs)
             try:
                 await client.test_connection()
-                await client.disconnect()
 
                 return self.async_update_reload_and_abort(
                     self._get_reconfigure_entry(),
@@ -169,6 +214,9 @@ class AVGearMatrixConfigFlow(ConfigFlow, domain=DOMAIN):
 class AVGearMatrixOptionsFlow(OptionsFlow):
     """Handle options flow for AVGear Matrix Switcher."""
 
+    _schema: vol.Schema | None = None
+    _schema_key: tuple[Any, ...] | None = None
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -178,30 +226,41 @@ class AVGearMatrixOptionsFlow(OptionsFlow):
         num_inputs = int(self.config_entry.data.get(CONF_NUM_INPUTS, NUM_INPUTS))
 
         if user_input is not None:
-            # Parse and strip all name fields
-            input_names = {}
-            for i in range(1, num_inputs + 1):
-                name = user_input.get(f"input_{i}_name", "").strip()
-                if name:
-                    input_names[str(i)] = name
-
-            preset_names = {}
-            for i in range(NUM_PRESETS):
-                name = user_input.get(f"preset_{i}_name", "").strip()
-                if name:
-                    preset_names[str(i)] = name
-
-            # Check for reserved or duplicate input names (would cause routing ambiguity)
-            input_name_values = list(input_names.values())
-            if any(name.strip().casefold() == "off" for name in input_name_values):
-                errors["base"] = "reserved_input_name"
-            elif len(input_name_values) != len(set(input_name_values)):
-                errors["base"] = "duplicate_input_names"
+            # Parse and strip all name fields in one pass over the form
+            input_names: dict[str, str] = {}
+            preset_names: dict[str, str] = {}
+            for key, value in user_input.items():
+                if not isinstance(value, str) or not key.endswith("_name"):
+                    continue
+                if not (name := value.strip()):
+                    continue
+                if key.startswith("input_"):
+                    input_names[key[6:-5]] = name
+                elif key.startswith("preset_"):
+                    preset_names[key[7:-5]] = name
+
+            # Check for reserved or duplicate input names in one pass
+            # (would cause routing ambiguity)
+            seen: set[str] = set()
+            for name in input_names.values():
+                folded = name.casefold()
+                if folded == "off":
+                    errors["base"] = "reserved_input_name"
+                    break
+                if folded in seen:
+                    errors["base"] = "duplicate_input_names"
+                    break
+                seen.add(folded)
 
             # Check for duplicate preset names (would cause selection ambiguity)
-            preset_name_values = list(preset_names.values())
-            if not errors and len(preset_name_values) != len(set(preset_name_values)):
-                errors["base"] = "duplicate_preset_names"
+            if not errors:
+                seen.clear()
+                for name in preset_names.values():
+                    folded = name.casefold()
+                    if folded in seen:
+                        errors["base"] = "duplicate_preset_names"
+                        break
+                    seen.add(folded)
 
             if not errors:
                 return self.async_create_entry(
@@ -223,45 +282,24 @@ class AVGearMatrixOptionsFlow(OptionsFlow):
         # Populate defaults from user_input if re-showing form after error
         if user_input is not None:
             current_interval = user_input.get(CONF_SCAN_INTERVAL, current_interval)
-            for i in range(1, num_inputs + 1):
-                val = user_input.get(f"input_{i}_name", "").strip()
-                if val:
-                    current_input_names[str(i)] = val
-            for i in range(NUM_PRESETS):
-                val = user_input.get(f"preset_{i}_name", "").strip()
-                if val:
-                    current_preset_names[str(i)] = val
-
-        # Name validator: enforce max length
-        name_validator = vol.All(str, vol.Length(max=MAX_NAME_LENGTH))
-
-        # Build schema with all name fields
-        schema_dict: dict[Any, Any] = {
-            vol.Required(CONF_SCAN_INTERVAL, default=current_interval): vol.All(
-                int, vol.Range(min=5, max=300)
-            ),
-        }
-
-        # Add input name fields with placeholders
-        for i in range(1, num_inputs + 1):
-            default_name = current_input_names.get(str(i), "")
-            schema_dict[vol.Optional(
-                f"input_{i}_name",
-                default=default_name,
-                description={"suggested_value": default_name or f"Input {i}"},
-            )] = name_validator
-
-        # Add preset name fields with placeholders
-        for i in range(NUM_PRESETS):
-            default_name = current_preset_names.get(str(i), "")
-            schema_dict[vol.Optional(
-                f"preset_{i}_name",
-                default=default_name,
-                description={"suggested_value": default_name or f"Preset {i}"},
-            )] = name_validator
+            current_input_names.update(input_names)
+            current_preset_names.update(preset_names)
+
+        # Rebuild the schema only when its inputs changed since the last render
+        schema_key = (
+            num_inputs,
+            current_interval,
+            tuple(current_input_names.items()),
+            tuple(current_preset_names.items()),
+        )
+        if self._schema is None or schema_key != self._schema_key:
+            self._schema_key = schema_key
+            self._schema = _build_options_schema(
+                num_inputs, current_interval, current_input_names, current_preset_names
+            )
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(schema_dict),
+            data_schema=self._schema,
             errors=errors,
         )
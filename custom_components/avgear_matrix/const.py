@@ -9,6 +9,7 @@ CONF_PORT = "port"
 # Defaults
 DEFAULT_PORT = 4001
 DEFAULT_SCAN_INTERVAL = 30
+REQUEST_REFRESH_COOLDOWN = 0.3  # Seconds to coalesce post-command refreshes
 
 # Options
 CONF_SCAN_INTERVAL = "scan_interval"
@@ -26,3 +27,4 @@ ATTR_FIRMWARE = "firmware"
 NUM_INPUTS = 8
 NUM_OUTPUTS = 8
 NUM_PRESETS = 10  # 0-9
+MAX_INPUTS_OUTPUTS = 32  # Largest input/output count accepted in config
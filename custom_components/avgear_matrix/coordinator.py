@@ -3,14 +3,27 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from datetime import timedelta
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator, UpdateFailed
 
 from .api import AVGearConnectionError, AVGearMatrixClient, MatrixStatus
-from .const import CONF_INPUT_NAMES, CONF_PRESET_NAMES, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    CONF_INPUT_NAMES,
+    CONF_NUM_INPUTS,
+    CONF_PRESET_NAMES,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    NUM_INPUTS,
+    NUM_PRESETS,
+    REQUEST_REFRESH_COOLDOWN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,10 +47,38 @@ class AVGearMatrixCoordinator(DataUpdateCoordinator[MatrixStatus]):
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
             config_entry=config_entry,
+            # Coalesce bursts of commands into one trailing refresh
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
+            # Only notify entities when a poll changes the status
+            always_update=False,
         )
         self.client = client
         self._device_info: dict[str, str] = {}
+        # Shared by every entity of this entry
+        self.entity_device_info = DeviceInfo(identifiers={(DOMAIN, config_entry.entry_id)})
         self._current_preset: int | None = None
+        # Options changes reload the entry (see async_update_options), so a
+        # fresh coordinator always picks up the current names
+        self._input_names: dict[str, str] = dict(config_entry.options.get(CONF_INPUT_NAMES, {}))
+        self._preset_names: dict[str, str] = dict(config_entry.options.get(CONF_PRESET_NAMES, {}))
+        # Display names with defaults filled in, resolved once per entry load
+        num_inputs = int(config_entry.data.get(CONF_NUM_INPUTS, NUM_INPUTS))
+        self.input_names: tuple[str, ...] = tuple(
+            self._input_names.get(str(i), f"Input {i}") for i in range(1, num_inputs + 1)
+        )
+        self.preset_names: tuple[str, ...] = tuple(
+            self._preset_names.get(str(i), f"Preset {i}") for i in range(NUM_PRESETS)
+        )
+        # Reverse maps for select options; built back to front so the
+        # lowest number wins if a custom name shadows a default one
+        self._input_num_by_name = {
+            name: i for i, name in reversed(list(enumerate(self.input_names, 1)))
+        }
+        self._preset_num_by_name = {
+            name: i for i, name in reversed(list(enumerate(self.preset_names)))
+        }
 
     @property
     def device_info(self) -> dict[str, str]:
@@ -56,57 +97,66 @@ class AVGearMatrixCoordinator(DataUpdateCoordinator[MatrixStatus]):
         out of sync (e.g., controlled by another client).
         """
         self._current_preset = None
+        self.async_update_listeners()
 
     async def async_setup(self) -> None:
         """Set up the coordinator and fetch initial device info."""
-        try:
-            info = await self.client.test_connection()
-            self._device_info = {
-                "model": info.get("model", "AVGear Matrix"),
-                "firmware": info.get("firmware", "Unknown"),
-            }
-        except AVGearConnectionError as err:
-            _LOGGER.error("Failed to connect to AVGear Matrix: %s", err)
-            raise
+        status = self.client.status
+        # A client handed over by the config flow already knows its device
+        if not status.model:
+            try:
+                await self.client.test_connection()
+            except AVGearConnectionError as err:
+                _LOGGER.error("Failed to connect to AVGear Matrix: %s", err)
+                raise
+        self._device_info = {
+            "model": status.model,
+            "firmware": status.firmware,
+        }
 
     async def _async_update_data(self) -> MatrixStatus:
         """Fetch data from the matrix."""
+        # Power and lock state are best effort inside the bundle; only a
+        # routing failure fails the update
+        # Hand out a snapshot: the client keeps mutating its own status, and
+        # always_update=False compares against the previous data
         try:
-            status = await self.client.get_status()
+            return (await self.client.get_status_bundle()).copy()
         except AVGearConnectionError as err:
             raise UpdateFailed(f"Error communicating with AVGear Matrix: {err}") from err
 
-        # Best-effort supplementary data — don't fail the whole update
-        try:
-            await self.client.get_power_state()
-        except AVGearConnectionError:
-            _LOGGER.debug("Failed to fetch power state")
-        try:
-            await self.client.get_lock_status()
-        except AVGearConnectionError:
-            _LOGGER.debug("Failed to fetch lock status")
+    async def _async_publish_optimistic(self) -> None:
+        """Publish the client's optimistic state and schedule a refresh.
 
-        return status
+        The client updates its status as soon as a command is sent, so
+        entities can show the change at once; the debounced refresh then
+        reconciles with the device.
+        """
+        self.async_set_updated_data(self.client.status.copy())
+        await self.async_request_refresh()
 
     async def async_route_input(self, input_num: int, output_num: int) -> None:
         """Route an input to an output and refresh."""
         await self.client.route_input_to_output(input_num, output_num)
-        await self.async_request_refresh()
+        await self._async_publish_optimistic()
 
     async def async_route_input_to_all(self, input_num: int) -> None:
         """Route an input to all outputs and refresh."""
         await self.client.route_input_to_all(input_num)
-        await self.async_request_refresh()
+        await self._async_publish_optimistic()
 
     async def async_switch_off_output(self, output_num: int) -> None:
         """Switch off an output and refresh."""
         await self.client.switch_off_output(output_num)
-        await self.async_request_refresh()
+        await self._async_publish_optimistic()
 
     async def async_recall_preset(self, preset: int) -> None:
         """Recall a preset and refresh."""
         await self.client.recall_preset(preset)
         self._current_preset = preset
+        # Publish the routing read with the recall, then re-poll once the
+        # matrix has had time to apply the preset
+        self.async_set_updated_data(self.client.status.copy())
         await self.async_request_refresh()
 
     async def async_save_preset(self, preset: int) -> None:
@@ -119,17 +169,17 @@ class AVGearMatrixCoordinator(DataUpdateCoordinator[MatrixStatus]):
             await self.client.lock_panel()
         else:
             await self.client.unlock_panel()
-        await self.async_request_refresh()
+        await self._async_publish_optimistic()
 
     async def async_all_through(self) -> None:
         """Route all inputs to corresponding outputs and refresh."""
         await self.client.all_through()
-        await self.async_request_refresh()
+        await self._async_publish_optimistic()
 
     async def async_all_off(self) -> None:
         """Switch off all outputs and refresh."""
         await self.client.switch_off_all()
-        await self.async_request_refresh()
+        await self._async_publish_optimistic()
 
     async def async_set_standby(self, standby: bool) -> None:
         """Set standby state."""
@@ -137,17 +187,34 @@ class AVGearMatrixCoordinator(DataUpdateCoordinator[MatrixStatus]):
             await self.client.standby()
         else:
             await self.client.power_on()
-        await self.async_request_refresh()
+        await self._async_publish_optimistic()
+
+    def names_changed(self, options: Mapping[str, Any]) -> bool:
+        """Return True if options carry different names than this coordinator."""
+        return (
+            options.get(CONF_INPUT_NAMES, {}) != self._input_names
+            or options.get(CONF_PRESET_NAMES, {}) != self._preset_names
+        )
 
     def get_input_name(self, input_num: int) -> str:
         """Get custom name for an input or return default."""
-        input_names = self.config_entry.options.get(CONF_INPUT_NAMES, {})
-        return input_names.get(str(input_num), f"Input {input_num}")
+        if 1 <= input_num <= len(self.input_names):
+            return self.input_names[input_num - 1]
+        return f"Input {input_num}"
+
+    def resolve_input_name(self, name: str) -> int | None:
+        """Return the input number shown as name, if any."""
+        return self._input_num_by_name.get(name)
+
+    def resolve_preset_name(self, name: str) -> int | None:
+        """Return the preset number shown as name, if any."""
+        return self._preset_num_by_name.get(name)
 
     def get_preset_name(self, preset_num: int) -> str:
         """Get custom name for a preset or return default."""
-        preset_names = self.config_entry.options.get(CONF_PRESET_NAMES, {})
-        return preset_names.get(str(preset_num), f"Preset {preset_num}")
+        if 0 <= preset_num < NUM_PRESETS:
+            return self.preset_names[preset_num]
+        return f"Preset {preset_num}"
 
 
 class AVGearBaseEntity(CoordinatorEntity[AVGearMatrixCoordinator]):
@@ -155,9 +222,31 @@ class AVGearBaseEntity(CoordinatorEntity[AVGearMatrixCoordinator]):
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: AVGearMatrixCoordinator) -> None:
-        """Initialize the base entity."""
+    def __init__(self, coordinator: AVGearMatrixCoordinator, key: str) -> None:
+        """Initialize the base entity; key is unique within the config entry."""
         super().__init__(coordinator)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
-        )
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{key}"
+        self._attr_device_info = coordinator.entity_device_info
+        self._last_state: tuple[bool, Any] | None = None
+
+    @callback
+    def _async_derive_state(self) -> None:
+        """Derive _attr_* state from the coordinator's current data."""
+
+    def _state_fingerprint(self) -> Any:
+        """Return the coordinator-derived values this entity exposes."""
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        """Derive the initial state and remember it as written."""
+        self._async_derive_state()
+        await super().async_added_to_hass()
+        self._last_state = (self.available, self._state_fingerprint())
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if availability or the exposed values changed."""
+        self._async_derive_state()
+        if (state := (self.available, self._state_fingerprint())) != self._last_state:
+            self._last_state = state
+            self.async_write_ha_state()
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import logging
+from abc import abstractmethod
 from typing import TYPE_CHECKING
 
 from homeassistant.components.select import SelectEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
@@ -14,7 +15,6 @@ from .const import (
     CONF_NUM_OUTPUTS,
     NUM_INPUTS,
     NUM_OUTPUTS,
-    NUM_PRESETS,
 )
 from .coordinator import AVGearBaseEntity, AVGearMatrixCoordinator
 
@@ -32,15 +32,20 @@ async def async_setup_entry(
     """Set up AVGear Matrix select entities."""
     coordinator = entry.runtime_data
 
+    # Read the matrix size once and hand it to the entities
+    num_inputs = int(entry.data.get(CONF_NUM_INPUTS, NUM_INPUTS))
     num_outputs = int(entry.data.get(CONF_NUM_OUTPUTS, NUM_OUTPUTS))
 
+    # One options list shared by every output select; it is never mutated
+    output_options = [*coordinator.input_names, "Off"]
+
     entities: list[SelectEntity] = [
-        AVGearMatrixOutputSelect(coordinator, output_num)
+        AVGearMatrixOutputSelect(coordinator, output_num, num_inputs, output_options)
         for output_num in range(1, num_outputs + 1)
     ]
 
     # Add "Route to All" select entity
-    entities.append(AVGearRouteToAllSelect(coordinator))
+    entities.append(AVGearRouteToAllSelect(coordinator, num_inputs))
 
     # Add preset select entity
     entities.append(AVGearPresetSelect(coordinator))
@@ -48,38 +53,53 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class AVGearMatrixOutputSelect(AVGearBaseEntity, SelectEntity):
+class AVGearSelectEntity(AVGearBaseEntity, SelectEntity):
+    """Base select entity.
+
+    The current option is derived once per coordinator update and kept in
+    _attr_current_option, so state writes read a stored value.
+    """
+
+    @abstractmethod
+    def _derive_current_option(self) -> str | None:
+        """Return the option matching the coordinator's current state."""
+
+    @callback
+    def _async_derive_state(self) -> None:
+        """Store the current option."""
+        self._attr_current_option = self._derive_current_option()
+
+    def _state_fingerprint(self) -> str | None:
+        """Return the current option."""
+        return self._attr_current_option
+
+
+class AVGearMatrixOutputSelect(AVGearSelectEntity):
     """Select entity for an AVGear Matrix output."""
 
     def __init__(
         self,
         coordinator: AVGearMatrixCoordinator,
         output_num: int,
+        num_inputs: int,
+        options: list[str],
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, f"output_{output_num}")
         self._output_num = output_num
-        self._num_inputs = int(coordinator.config_entry.data.get(CONF_NUM_INPUTS, NUM_INPUTS))
+        self._num_inputs = num_inputs
 
-        # Entity attributes
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_output_{output_num}"
+        # Entity attributes; names only change through an entry reload
         self._attr_name = f"Output {output_num}"
+        self._attr_options = options
 
-    @property
-    def options(self) -> list[str]:
-        """Return available input options dynamically."""
-        options = [self.coordinator.get_input_name(i) for i in range(1, self._num_inputs + 1)]
-        options.append("Off")
-        return options
-
-    @property
-    def current_option(self) -> str | None:
+    def _derive_current_option(self) -> str | None:
         """Return the current selected input."""
-        if self.coordinator.data is None:
+        if (data := self.coordinator.data) is None:
             return None
 
-        input_num = self.coordinator.data.outputs.get(self._output_num)
-        if input_num is None or input_num == 0:
+        input_num = data.get_output_input(self._output_num)
+        if input_num is None:
             return "Off"
         if 1 <= input_num <= self._num_inputs:
             return self.coordinator.get_input_name(input_num)
@@ -90,81 +110,56 @@ class AVGearMatrixOutputSelect(AVGearBaseEntity, SelectEntity):
         if option == "Off":
             await self.coordinator.async_switch_off_output(self._output_num)
         else:
-            # Find input number by matching name
-            input_num = None
-            for i in range(1, self._num_inputs + 1):
-                if self.coordinator.get_input_name(i) == option:
-                    input_num = i
-                    break
-
+            input_num = self.coordinator.resolve_input_name(option)
             if input_num:
                 await self.coordinator.async_route_input(input_num, self._output_num)
             else:
                 _LOGGER.error("Invalid input option: %s", option)
 
 
-class AVGearRouteToAllSelect(AVGearBaseEntity, SelectEntity):
+class AVGearRouteToAllSelect(AVGearSelectEntity):
     """Select entity to route an input to all outputs."""
 
     def __init__(
         self,
         coordinator: AVGearMatrixCoordinator,
+        num_inputs: int,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
-        self._num_inputs = int(coordinator.config_entry.data.get(CONF_NUM_INPUTS, NUM_INPUTS))
-        self._num_outputs = int(coordinator.config_entry.data.get(CONF_NUM_OUTPUTS, NUM_OUTPUTS))
+        super().__init__(coordinator, "route_to_all")
+        self._num_inputs = num_inputs
 
-        # Entity attributes
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_route_to_all"
+        # Entity attributes; names only change through an entry reload
         self._attr_name = "Route to All Outputs"
         self._attr_icon = "mdi:video-input-hdmi"
+        self._attr_options = list(coordinator.input_names)
 
-    @property
-    def options(self) -> list[str]:
-        """Return available input options dynamically."""
-        return [self.coordinator.get_input_name(i) for i in range(1, self._num_inputs + 1)]
-
-    @property
-    def current_option(self) -> str | None:
+    def _derive_current_option(self) -> str | None:
         """Return the current option if all outputs share the same input."""
-        if self.coordinator.data is None:
-            return None
-
-        # Check if all outputs are routed to the same input
-        outputs = self.coordinator.data.outputs
-        if not outputs:
+        if (data := self.coordinator.data) is None:
             return None
 
-        first_input = outputs.get(1)
-        if first_input is None:
+        # Check if all outputs are routed to the same input in one C-level
+        # pass; off (0) or mixed routing shows no selection
+        outputs = data.outputs
+        first_input = outputs[0] if outputs else 0
+        if not first_input or outputs.count(first_input) != len(outputs):
             return None
 
-        # Check if all outputs match
-        for out in range(1, self._num_outputs + 1):
-            if outputs.get(out) != first_input:
-                return None  # Not all same, no selection shown
-
         if 1 <= first_input <= self._num_inputs:
             return self.coordinator.get_input_name(first_input)
         return None
 
     async def async_select_option(self, option: str) -> None:
         """Route selected input to all outputs."""
-        # Find input number by matching name
-        input_num = None
-        for i in range(1, self._num_inputs + 1):
-            if self.coordinator.get_input_name(i) == option:
-                input_num = i
-                break
-
+        input_num = self.coordinator.resolve_input_name(option)
         if input_num:
             await self.coordinator.async_route_input_to_all(input_num)
         else:
             _LOGGER.error("Invalid input option: %s", option)
 
 
-class AVGearPresetSelect(AVGearBaseEntity, SelectEntity):
+class AVGearPresetSelect(AVGearSelectEntity):
     """Select entity to recall a preset."""
 
     _attr_name = "Preset"
@@ -175,16 +170,11 @@ class AVGearPresetSelect(AVGearBaseEntity, SelectEntity):
         coordinator: AVGearMatrixCoordinator,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_preset"
+        super().__init__(coordinator, "preset")
+        # Names only change through an entry reload
+        self._attr_options = list(coordinator.preset_names)
 
-    @property
-    def options(self) -> list[str]:
-        """Return available preset options dynamically."""
-        return [self.coordinator.get_preset_name(i) for i in range(NUM_PRESETS)]
-
-    @property
-    def current_option(self) -> str | None:
+    def _derive_current_option(self) -> str | None:
         """Return the currently selected preset."""
         preset = self.coordinator.current_preset
         if preset is None:
@@ -193,13 +183,7 @@ class AVGearPresetSelect(AVGearBaseEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Recall the selected preset."""
-        # Find preset number by matching name
-        preset_num = None
-        for i in range(NUM_PRESETS):
-            if self.coordinator.get_preset_name(i) == option:
-                preset_num = i
-                break
-
+        preset_num = self.coordinator.resolve_preset_name(option)
         if preset_num is not None:
             await self.coordinator.async_recall_preset(preset_num)
         else:
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from abc import abstractmethod
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -31,24 +32,43 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class AVGearPanelLockSwitch(AVGearBaseEntity, SwitchEntity):
+class AVGearSwitchEntity(AVGearBaseEntity, SwitchEntity):
+    """Base switch entity.
+
+    The on state is derived once per coordinator update and kept in
+    _attr_is_on, so state writes read a stored value.
+    """
+
+    @abstractmethod
+    def _derive_is_on(self) -> bool:
+        """Return the on state for the coordinator's current data."""
+
+    @callback
+    def _async_derive_state(self) -> None:
+        """Store the on state."""
+        self._attr_is_on = self._derive_is_on()
+
+    def _state_fingerprint(self) -> bool | None:
+        """Return the on state."""
+        return self._attr_is_on
+
+
+class AVGearPanelLockSwitch(AVGearSwitchEntity):
     """Switch to control panel lock."""
 
     _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(self, coordinator: AVGearMatrixCoordinator) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_panel_lock"
+        super().__init__(coordinator, "panel_lock")
         self._attr_name = "Panel Lock"
         self._attr_icon = "mdi:lock"
 
-    @property
-    def is_on(self) -> bool:
+    def _derive_is_on(self) -> bool:
         """Return true if panel is locked."""
-        if self.coordinator.data is None:
+        if (data := self.coordinator.data) is None:
             return False
-        return self.coordinator.data.locked
+        return data.locked
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Lock the panel."""
@@ -59,24 +79,22 @@ class AVGearPanelLockSwitch(AVGearBaseEntity, SwitchEntity):
         await self.coordinator.async_set_panel_lock(False)
 
 
-class AVGearStandbySwitch(AVGearBaseEntity, SwitchEntity):
+class AVGearStandbySwitch(AVGearSwitchEntity):
     """Switch to control standby mode."""
 
     _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(self, coordinator: AVGearMatrixCoordinator) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_standby"
+        super().__init__(coordinator, "standby")
         self._attr_name = "Standby"
         self._attr_icon = "mdi:power-standby"
 
-    @property
-    def is_on(self) -> bool:
+    def _derive_is_on(self) -> bool:
         """Return true if in standby mode."""
-        if self.coordinator.data is None:
+        if (data := self.coordinator.data) is None:
             return False
-        return self.coordinator.data.power_state in ("STANDBY", "PWOFF")
+        return data.power_state in ("STANDBY", "PWOFF")
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enter standby mode."""